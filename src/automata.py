@@ -18,6 +18,21 @@ class FastGrid:
             self.data[y * self.width + x] = value
 
 
+    def summed_area_table(self):
+        # Integral image with an extra zero row/column: sat[(y+1)*(w+1) + (x+1)] = live cells in [0..x] x [0..y]
+        w = self.width + 1
+        sat = [0] * (w * (self.height + 1))
+        for y in range(self.height):
+            row_sum = 0
+            row = y * self.width
+            above = y * w
+            here = above + w
+            for x in range(self.width):
+                if self.data[row + x]:
+                    row_sum += 1
+                sat[here + x + 1] = sat[above + x + 1] + row_sum
+        return sat
+
     def __str__(self): 
         lines = []
         for y in range(self.height):
@@ -25,11 +40,109 @@ class FastGrid:
             lines.append(line)
         return '\n'.join(lines)
 
+class Neighbourhood:
+    # Offsets are stored as rectangles (dy_start, dy_end, dx_start, dx_end), each one a single summed-area table lookup.
+    # The centre is always filled in when building them and subtracted again when excluded, so it never splits a row.
+    def __init__(self, offsets, include_center: bool = False):
+        if (0, 0) in offsets and not include_center:
+            raise ValueError("Offsets contain the centre (0, 0) but include_center is False")
+        self.include_center = include_center
+        self.offsets = sorted(set(offsets) - {(0, 0)})
+        self.size = len(self.offsets) + (1 if include_center else 0)
+        self.rects = self.build_rects(self.offsets + [(0, 0)])
+
+    @staticmethod
+    def build_rects(offsets):
+        rows = defaultdict(list)
+        for dx, dy in offsets:
+            rows[dy].append(dx)
+
+        rects = []
+        open_rects = {}  # (dx_start, dx_end) -> index of the rectangle that ended on the previous row
+        for dy in sorted(rows):
+            xs = sorted(rows[dy])
+            runs = []
+            start = prev = xs[0]
+            for dx in xs[1:]:
+                if dx != prev + 1:
+                    runs.append((start, prev))
+                    start = dx
+                prev = dx
+            runs.append((start, prev))
+
+            still_open = {}
+            for run in runs:
+                index = open_rects.get(run)
+                if index is not None and rects[index][1] == dy - 1:
+                    dy0, _, x0, x1 = rects[index]
+                    rects[index] = (dy0, dy, x0, x1)
+                else:
+                    index = len(rects)
+                    rects.append((dy, dy, run[0], run[1]))
+                still_open[run] = index
+            open_rects = still_open
+        return rects
+
+    @staticmethod
+    def check_radius(radius):
+        if radius < 1:
+            raise ValueError(f"Radius must be at least 1, got {radius}")
+
+    @classmethod
+    def moore(cls, radius: int = 1, include_center: bool = False):
+        cls.check_radius(radius)
+        offsets = [(dx, dy) for dy in range(-radius, radius + 1) for dx in range(-radius, radius + 1)
+                   if (dx, dy) != (0, 0)]
+        return cls(offsets, include_center)
+
+    @classmethod
+    def von_neumann(cls, radius: int = 1, include_center: bool = False):
+        cls.check_radius(radius)
+        offsets = [(dx, dy) for dy in range(-radius, radius + 1) for dx in range(-radius, radius + 1)
+                   if 0 < abs(dx) + abs(dy) <= radius]
+        return cls(offsets, include_center)
+
+    @classmethod
+    def from_mask(cls, mask):
+        # mask is a list of rows with odd dimensions, centered on the cell; the centre value decides if the cell counts itself
+        if not mask or not mask[0]:
+            raise ValueError("Mask must not be empty")
+        if len(mask) % 2 == 0 or any(len(row) != len(mask[0]) for row in mask) or len(mask[0]) % 2 == 0:
+            raise ValueError("Mask must be rectangular with odd dimensions")
+        cy = len(mask) // 2
+        cx = len(mask[0]) // 2
+        offsets = [(x - cx, y - cy) for y, row in enumerate(mask) for x, value in enumerate(row) if value]
+        return cls(offsets, bool(mask[cy][cx]))
+
+    @staticmethod
+    def rect_sum(sat, width, height, top, bottom, left, right):
+        top = max(top, 0)
+        bottom = min(bottom, height - 1)
+        left = max(left, 0)
+        right = min(right, width - 1)
+        if top > bottom or left > right:
+            return 0
+        w = width + 1
+        upper = top * w
+        lower = (bottom + 1) * w
+        return sat[lower + right + 1] - sat[lower + left] - sat[upper + right + 1] + sat[upper + left]
+
+    def count(self, sat, width, height, x, y):
+        # Moore is a single rectangle (minus the centre when excluded), so it is O(1) per cell at any radius;
+        # von Neumann and custom masks cost one lookup per distinct row span
+        total = 0
+        for dy0, dy1, x0, x1 in self.rects:
+            total += self.rect_sum(sat, width, height, y + dy0, y + dy1, x + x0, x + x1)
+        if not self.include_center:
+            total -= self.rect_sum(sat, width, height, y, y, x, x)
+        return total
+
 class Automata(ABC):
     def create_grid(self):
         self.grid = FastGrid(self.width, self.height)
 
-    def __init__(self, name: str, height: int, width: int, generations: int, initial_state: Optional[list] = None):
+    def __init__(self, name: str, width: int, height: int, generations: int, initial_state: Optional[list] = None,
+                 neighbourhood: Optional[Neighbourhood] = None):
         self.name = name
         self.width = width
         self.height = height
@@ -38,11 +151,14 @@ class Automata(ABC):
         self.grid = None
         self.live_cells = set()
         self.live_cells_neighbours = dict()
+        self.neighbourhood = neighbourhood or Neighbourhood.moore(1)
+        self.neighbour_counts = []
         self.create_grid()
 
     def set_cell(self, x, y, state):
         if 0 <= x < self.width and 0 <= y < self.height:
             self.grid.set(x, y, state)
+            self.neighbour_counts = []
             if not state:
                 cell = (x, y)
                 self.live_cells_neighbours.pop(cell, None)
@@ -105,12 +221,8 @@ class Automata(ABC):
         self.update_grid(cx, cy, True)
 
     def count_neighbours(self):
-        neighbor_offsets = [
-            (-1, -1), (-1, 0), (-1, 1),
-            (0, -1),           (0, 1),
-            (1, -1),  (1, 0),  (1, 1)
-        ]
-        
+        neighbor_offsets = self.neighbourhood.offsets
+
         for cell in self.live_cells:
             neighbours = []  # List for neighbors of the current cell
             for row_offset, col_offset in neighbor_offsets:
@@ -122,6 +234,43 @@ class Automata(ABC):
     def get_neighbours(self, x, y):
         return self.live_cells_neighbours.get((x, y), [])
 
+    def count_live_neighbours(self):
+        # Rebuild the summed-area table once per generation, then every cell's count is a few table lookups
+        sat = self.grid.summed_area_table()
+        count = self.neighbourhood.count
+        self.neighbour_counts = [count(sat, self.width, self.height, x, y)
+                                 for y in range(self.height) for x in range(self.width)]
+
+    def get_neighbour_count(self, x, y):
+        if not self.neighbour_counts:
+            self.count_live_neighbours()
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.neighbour_counts[y * self.width + x]
+        return 0
+
+    def apply_generation(self, rule):
+        # Count based rules are a callback rule(alive, live_neighbours) -> bool; live_neighbours is taken from the
+        # summed-area counts of the previous generation, so the rule never has to look up neighbours itself.
+        # Outside a generation the same counts are available through get_neighbour_count
+        self.count_live_neighbours()
+        counts = self.neighbour_counts
+        for y in range(self.height):
+            for x in range(self.width):
+                alive = bool(self.get_cell(x, y))
+                new_state = rule(alive, counts[y * self.width + x])
+                if new_state != alive:
+                    self.update_grid(x, y, new_state)
+        self.live_cells_neighbours.clear()
+
+    @staticmethod
+    def default_neighbourhood(radius, neighbourhood, default_radius):
+        # Count based rules take either a Moore radius (centre included) or a full neighbourhood, not both
+        if neighbourhood is not None:
+            if radius is not None:
+                raise ValueError("Pass either radius or neighbourhood, not both")
+            return neighbourhood
+        return Neighbourhood.moore(default_radius if radius is None else radius, include_center=True)
+
     @abstractmethod
     def run_automata(self):
         pass
@@ -136,6 +285,39 @@ class Conways(Automata):
             #here im going to loop trough each cell in living cells and start applying the rules
 
 
+class MajorityRule(Automata):
+    def __init__(self, width, height, generations, initial_state=None, radius: Optional[int] = None,
+                 neighbourhood=None):
+        neighbourhood = self.default_neighbourhood(radius, neighbourhood, 1)
+        super().__init__('Majority', width, height, generations, initial_state, neighbourhood)
+
+    def majority(self, alive, live_neighbours):
+        # Strict majority wins, a tie keeps the current state
+        dead_neighbours = self.neighbourhood.size - live_neighbours
+        if live_neighbours == dead_neighbours:
+            return alive
+        return live_neighbours > dead_neighbours
+
+    def run_automata(self):
+        for generation in range(self.generations):
+            self.apply_generation(self.majority)
+
+class LargerThanLife(Automata):
+    # Birth and survival are inclusive (min, max) ranges of live neighbours; the defaults are Evans' Bosco rule
+    def __init__(self, width, height, generations, initial_state=None, radius: Optional[int] = None,
+                 birth=(34, 45), survival=(33, 57), neighbourhood=None):
+        neighbourhood = self.default_neighbourhood(radius, neighbourhood, 5)
+        super().__init__('Larger than Life', width, height, generations, initial_state, neighbourhood)
+        self.birth = birth
+        self.survival = survival
+
+    def larger_than_life(self, alive, live_neighbours):
+        low, high = self.survival if alive else self.birth
+        return low <= live_neighbours <= high
+
+    def run_automata(self):
+        for generation in range(self.generations):
+            self.apply_generation(self.larger_than_life)
 
 #other implementations will come here (other automata rules)
 #judge my code, in the implementation of the rules, the user should mostly just interact with get and set cell AND get neighbours
\ No newline at end of file
@@ -0,0 +1,116 @@
+import random
+
+import pytest
+
+from automata import FastGrid, LargerThanLife, MajorityRule, Neighbourhood
+
+
+def random_grid(width, height, seed):
+    rng = random.Random(seed)
+    grid = FastGrid(width, height)
+    grid.data = [rng.random() < 0.4 for _ in grid.data]
+    return grid
+
+
+def naive_count(grid, neighbourhood, x, y):
+    offsets = neighbourhood.offsets + ([(0, 0)] if neighbourhood.include_center else [])
+    return sum(1 for dx, dy in offsets if grid.get(x + dx, y + dy))
+
+
+@pytest.mark.parametrize('neighbourhood', [
+    Neighbourhood.moore(1),
+    Neighbourhood.moore(3, include_center=True),
+    Neighbourhood.von_neumann(2),
+    Neighbourhood.von_neumann(4, include_center=True),
+    Neighbourhood.from_mask([[1, 0, 1], [0, 1, 0], [1, 1, 1]]),
+    Neighbourhood.from_mask([[1, 1, 1, 1, 1], [1, 0, 0, 0, 1], [1, 0, 0, 0, 1], [1, 0, 0, 0, 1], [1, 1, 1, 1, 1]]),
+])
+def test_summed_area_count_matches_naive(neighbourhood):
+    grid = random_grid(13, 9, seed=len(neighbourhood.offsets))
+    sat = grid.summed_area_table()
+    for y in range(grid.height):
+        for x in range(grid.width):
+            assert neighbourhood.count(sat, grid.width, grid.height, x, y) == naive_count(grid, neighbourhood, x, y)
+
+
+@pytest.mark.parametrize('radius', [1, 5, 10])
+def test_moore_is_a_single_rectangle(radius):
+    assert Neighbourhood.moore(radius).rects == [(-radius, radius, -radius, radius)]
+    assert Neighbourhood.moore(radius, include_center=True).rects == [(-radius, radius, -radius, radius)]
+
+
+def test_from_mask_uses_mask_centre():
+    assert Neighbourhood.from_mask([[0, 0, 0], [0, 1, 0], [0, 0, 0]]).size == 1
+    assert Neighbourhood.from_mask([[1, 1, 1], [1, 0, 1], [1, 1, 1]]).size == 8
+
+
+@pytest.mark.parametrize('mask', [[], [[]], [[1, 1], [1, 1]], [[1, 1, 1], [1, 1]]])
+def test_from_mask_rejects_bad_masks(mask):
+    with pytest.raises(ValueError):
+        Neighbourhood.from_mask(mask)
+
+
+@pytest.mark.parametrize('radius', [0, -1])
+def test_rejects_non_positive_radius(radius):
+    with pytest.raises(ValueError):
+        Neighbourhood.moore(radius)
+    with pytest.raises(ValueError):
+        Neighbourhood.von_neumann(radius)
+
+
+def test_automata_keeps_width_and_height():
+    automata = MajorityRule(7, 5, 1)
+    assert (automata.width, automata.height) == (7, 5)
+    assert (automata.grid.width, automata.grid.height) == (7, 5)
+
+
+def test_majority_rule_step():
+    automata = MajorityRule(9, 9, 1, 'Block')
+    automata.set_initial_state()
+    automata.run_automata()
+    # The 3x3 block loses its corners (4 of 9 alive) and keeps its edges (6 of 9) and centre
+    assert automata.live_cells == {(4, 4), (3, 4), (5, 4), (4, 3), (4, 5)}
+    assert automata.get_neighbour_count(4, 4) == 5
+
+
+def test_majority_rule_tie_keeps_state():
+    automata = MajorityRule(3, 1, 1, neighbourhood=Neighbourhood.from_mask([[1, 0, 1]]))
+    automata.update_grid(0, 0, True)
+    automata.update_grid(1, 0, True)
+    automata.run_automata()
+    # Every cell sees one live and one dead (or out of bounds) neighbour, so nothing changes
+    assert automata.live_cells == {(0, 0), (1, 0)}
+
+
+def test_larger_than_life_birth_and_survival():
+    automata = LargerThanLife(5, 5, 1, radius=1, birth=(3, 3), survival=(3, 4))
+    for cell in [(1, 1), (2, 1), (3, 1)]:
+        automata.update_grid(*cell, True)
+    automata.run_automata()
+    # With the centre included this is Conway's B3/S23, so the blinker flips to vertical
+    assert automata.live_cells == {(2, 0), (2, 1), (2, 2)}
+
+
+def test_centre_offset_requires_include_center():
+    with pytest.raises(ValueError):
+        Neighbourhood([(0, 0), (1, 0)])
+    assert Neighbourhood([(0, 0), (1, 0)], include_center=True).size == 2
+
+
+def test_neighbour_count_follows_grid_changes():
+    automata = MajorityRule(5, 5, 1)
+    assert automata.get_neighbour_count(2, 2) == 0
+    automata.update_grid(2, 2, True)
+    automata.update_grid(1, 2, True)
+    assert automata.get_neighbour_count(2, 2) == 2
+    automata.update_grid(1, 2, False)
+    assert automata.get_neighbour_count(2, 2) == 1
+
+
+def test_radius_and_neighbourhood_are_exclusive():
+    with pytest.raises(ValueError):
+        LargerThanLife(5, 5, 1, radius=7, neighbourhood=Neighbourhood.von_neumann(2))
+    with pytest.raises(ValueError):
+        MajorityRule(5, 5, 1, radius=2, neighbourhood=Neighbourhood.moore(1))
+    assert LargerThanLife(5, 5, 1).neighbourhood.size == 121
+    assert MajorityRule(5, 5, 1, radius=2).neighbourhood.size == 25